@@ -1,6 +1,9 @@
 """Auth JWKS module."""
 
+import asyncio
+import time
 import typing
+import weakref
 from dataclasses import dataclass
 from dataclasses import field
 
@@ -10,6 +13,7 @@ from authlib.jose import JsonWebToken
 from authlib.jose import JWTClaims
 from authlib.jose import KeySet
 from authlib.jose import errors
+from cachetools import TTLCache
 from starlette.requests import Request
 from starlette.responses import RedirectResponse
 
@@ -17,11 +21,33 @@ from app.auth.auth_interface import AuthInterface
 from app.auth.exceptions import Oauth2Error
 from app.config.logging import create_logger
 
-# from cachetools import cached
-# from cachetools import TTLCache
+logger = create_logger("app.auth.auth_jwks")
 
+# one client per event loop, pooled connections cannot be shared across loops
+_http_clients: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, httpx.AsyncClient
+] = weakref.WeakKeyDictionary()
 
-logger = create_logger("app.auth.auth_jwks")
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the HTTP client used to reach the identity provider.
+
+    The client is created lazily for the running event loop and reused by
+    every request served on that loop. It is closed by close_http_client.
+    """
+    loop = asyncio.get_running_loop()
+    client = _http_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient()
+        _http_clients[loop] = client
+    return client
+
+
+async def close_http_client() -> None:
+    """Close the HTTP client bound to the running event loop, if any."""
+    client = _http_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
 
 
 @dataclass
@@ -29,6 +55,8 @@ class JWKSConfig:
     """JWKS configuration instance."""
 
     jwks_uri: str = field(default="")
+    jwks_ttl: int = field(default=3600)
+    jwks_refresh_interval: int = field(default=60)
 
 
 class JWKSAuthentication(AuthInterface):
@@ -37,31 +65,64 @@ class JWKSAuthentication(AuthInterface):
     def __init__(self, config: JWKSConfig) -> None:
         """Initialize the authentication."""
         self.config = config
+        self.jwks_cache: TTLCache = TTLCache(maxsize=1, ttl=config.jwks_ttl)
+        self.jwks_fetched_at: typing.Optional[float] = None
+        self.jwt = JsonWebToken(["RS256"])
 
-    # @cached(TTLCache(maxsize=1, ttl=3600))
-    async def get_jwks(self) -> KeySet:
+    async def get_jwks(self, refresh: bool = False) -> KeySet:
         """Get cached or new JWKS."""
         url = self.config.jwks_uri
-        logger.info(f"Fetching JSON Web Key Set from {url}")
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url)
-            return JsonWebKey.import_key_set(response.json())
+        jwks = None if refresh else self.jwks_cache.get(url)
+        if jwks is None:
+            logger.info(f"Fetching JSON Web Key Set from {url}")
+            # failed attempts count too so that an outage is not hammered
+            self.jwks_fetched_at = time.monotonic()
+            try:
+                response = await get_http_client().get(url)
+                response.raise_for_status()
+                jwks = JsonWebKey.import_key_set(response.json())
+            except (httpx.HTTPError, ValueError, errors.JoseError) as e:
+                logger.error(f"Unable to fetch JSON Web Key Set: {e}")
+                raise Oauth2Error("Unable to fetch JSON Web Key Set")  # noqa
+            self.jwks_cache[url] = jwks
+        return jwks
+
+    def can_refresh_jwks(self) -> bool:
+        """Tell whether the last fetch attempt is old enough to refetch."""
+        return (
+            self.jwks_fetched_at is None
+            or time.monotonic() - self.jwks_fetched_at
+            >= self.config.jwks_refresh_interval
+        )
+
+    def decode_with_jwks(self, token: str, jwks: KeySet) -> JWTClaims:
+        """Decode JWT with the given key set."""
+        return self.jwt.decode(
+            s=token,
+            key=jwks,
+            # claim_options={
+            #     # Example of validating audience to match expected value
+            #     # "aud": {"essential": True, "values": [APP_CLIENT_ID]}
+            # }
+        )
 
     async def decode_token(
         self,
         token: str,
     ) -> JWTClaims:
         """Validate and decode JWT."""
+        jwks = await self.get_jwks()
         try:
-            jwks = await self.get_jwks()
-            claims = JsonWebToken(["RS256"]).decode(
-                s=token,
-                key=jwks,
-                # claim_options={
-                #     # Example of validating audience to match expected value
-                #     # "aud": {"essential": True, "values": [APP_CLIENT_ID]}
-                # }
-            )
+            try:
+                claims = self.decode_with_jwks(token, jwks)
+            except ValueError:
+                # the signing key may have been rotated since the set was cached,
+                # refetch it at most once per interval so that unknown kids
+                # cannot force a request to the identity provider every time
+                if not self.can_refresh_jwks():
+                    raise
+                jwks = await self.get_jwks(refresh=True)
+                claims = self.decode_with_jwks(token, jwks)
             if "client_id" in claims:
                 # Insert Cognito's `client_id` into `aud` claim if `aud` claim is unset
                 claims.setdefault("aud", claims["client_id"])
@@ -69,7 +130,7 @@ class JWKSAuthentication(AuthInterface):
         except errors.ExpiredTokenError:
             logger.error("Unable to validate an expired token")
             raise Oauth2Error("Unable to validate an expired token")  # noqa
-        except errors.JoseError:
+        except (errors.JoseError, ValueError):
             logger.error("Unable to decode token")
             raise Oauth2Error("Unable to decode token")  # noqa
 
@@ -83,9 +144,9 @@ class JWKSAuthentication(AuthInterface):
         """Authenticate the caller with the incoming request."""
         bearer = request.headers.get("Authorization")
         if not bearer:
-            logger.exception("Unable to get a token")
+            logger.error("Unable to get a token")
             raise Oauth2Error("Auth token not found")
-        access_token = bearer.replace("Bearer ", "")
+        access_token = bearer.removeprefix("Bearer ")
         try:
             claims = await self.decode_token(access_token)
             if not claims:
@@ -74,6 +74,9 @@ class DevConfig(GlobalConfig):
     OAUTH2_JWKS_ENDPOINT: Optional[str] = pydantic.Field(
         None, env="DEV_OAUTH2_JWKS_ENDPOINT"  # type: ignore
     )
+    OAUTH2_JWKS_TTL: Optional[int] = pydantic.Field(
+        None, env="DEV_OAUTH2_JWKS_TTL"  # type: ignore
+    )
     OAUTH2_TOKEN_ENDPOINT: Optional[str] = pydantic.Field(
         None, env="DEV_OAUTH2_TOKEN_ENDPOINT"  # type: ignore
     )
@@ -147,6 +150,9 @@ class ProdConfig(GlobalConfig):
     OAUTH2_JWKS_ENDPOINT: Optional[str] = pydantic.Field(
         None, env="PROD_OAUTH2_JWKS_ENDPOINT"  # type: ignore
     )
+    OAUTH2_JWKS_TTL: Optional[int] = pydantic.Field(
+        None, env="PROD_OAUTH2_JWKS_TTL"  # type: ignore
+    )
     OAUTH2_TOKEN_ENDPOINT: Optional[str] = pydantic.Field(
         None, env="PROD_OAUTH2_TOKEN_ENDPOINT"  # type: ignore
     )
@@ -175,18 +181,26 @@ class ProdConfig(GlobalConfig):
 class FactoryConfig:
     """Returns a config instance depending on the ENV_STATE variable."""
 
-    def __init__(self, env_state: Optional[str]):
+    def __init__(
+        self, env_state: Optional[str], global_config: Optional[GlobalConfig] = None
+    ):
         """Initialize factory configuration."""
         self.env_state = env_state
+        self.global_config = global_config
 
     @lru_cache()
     def __call__(self):
         """Handle runtime configuration."""
+        global_config = self.global_config or GlobalConfig()
         if self.env_state == "dev":
-            return DevConfig(**GlobalConfig().model_dump())
+            return DevConfig(**global_config.model_dump())
 
         elif self.env_state == "prod":
-            return ProdConfig(**GlobalConfig().model_dump())
+            return ProdConfig(**global_config.model_dump())
 
 
-configuration = FactoryConfig(env_state=GlobalConfig().ENV_STATE)()
+# parsed once and shared with the factory to avoid reading the .env file twice
+global_configuration = GlobalConfig()
+configuration = FactoryConfig(
+    env_state=global_configuration.ENV_STATE, global_config=global_configuration
+)()
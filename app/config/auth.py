@@ -1,5 +1,8 @@
 """Authn and Authz module."""
 
+from typing import Any
+from typing import Dict
+
 from fastapi_opa import OPAConfig
 from fastapi_opa.auth import OIDCAuthentication
 from fastapi_opa.auth import OIDCConfig
@@ -25,6 +28,10 @@ if cfg.OPA_ENABLED:
     oidc_auth = OIDCAuthentication(oidc_config)
     auth_config = OPAConfig(authentication=oidc_auth, opa_host=opa_host)
 elif cfg.JWKS_ENABLED:
-    jwks_config = JWKSConfig(jwks_uri=cfg.OAUTH2_JWKS_ENDPOINT)
+    jwks_options: Dict[str, Any] = {"jwks_uri": cfg.OAUTH2_JWKS_ENDPOINT}
+    # seconds the key set is cached, 0 disables caching and unset keeps the default
+    if cfg.OAUTH2_JWKS_TTL is not None:
+        jwks_options["jwks_ttl"] = cfg.OAUTH2_JWKS_TTL
+    jwks_config = JWKSConfig(**jwks_options)
     jwks_auth = JWKSAuthentication(jwks_config)
     auth_config = Oauth2Provider(authentication=jwks_auth)
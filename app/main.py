@@ -138,9 +138,11 @@ def create_app():  # noqa: C901
             raise ValueError(
                 "OPA_ENABLED, JWKS_ENABLED and API_KEY_ENABLED are mutually exclusive"
             )
+        from app.auth.auth_jwks import close_http_client
         from app.config.auth import auth_config
 
         PYGEOAPI_APP.add_middleware(Oauth2Middleware, config=auth_config)
+        app.add_event_handler("shutdown", close_http_client)
 
         security_schemes = [
             SecurityScheme(
@@ -1,9 +1,13 @@
 """Openapi middleware module."""
 
+import hashlib
 from typing import Any
 from typing import Dict
 from typing import List
+from typing import MutableMapping
+from typing import Optional
 
+from cachetools import LRUCache
 from openapi_pydantic.v3.v3_0_3 import SecurityScheme
 from starlette.datastructures import Headers
 from starlette.datastructures import MutableHeaders
@@ -21,6 +25,8 @@ logger = create_logger("app.middleware.pygeoapi")
 
 routes_with_openapi = [f"{cfg.FASTGEOAPI_CONTEXT}/openapi"]
 queryparams_with_openapi = ["f=json"]
+# number of distinct pygeoapi documents (e.g. per language) kept augmented
+augmented_openapi_cache_size = 8
 
 
 class OpenapiSecurityMiddleware:
@@ -30,24 +36,24 @@ class OpenapiSecurityMiddleware:
         """Initialize the Openapi security middleware."""
         self.app = app
         self.security_schemes = security_schemes
+        self.augmented_bodies = LRUCache(
+            maxsize=augmented_openapi_cache_size
+        )  # type: LRUCache[bytes, bytes]
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send):
         """Call the Openapi middleware."""
         if scope["type"] != "http":
             return await self.app(scope, receive, send)
-        pygeoapi_path = scope["path"]
-        pygeoapi_query_params = scope["query_string"].decode()
-        if (
-            pygeoapi_path not in routes_with_openapi
-            or pygeoapi_query_params == "f=html"
-        ):
+        if scope["path"] not in routes_with_openapi:
             return await self.app(scope, receive, send)
-        else:
-            if pygeoapi_query_params in queryparams_with_openapi:
-                openapi_responder = OpenAPIResponder(self.app, self.security_schemes)
-                await openapi_responder(scope, receive, send)
-                return
-            await self.app(scope, receive, send)
+        pygeoapi_query_params = scope["query_string"].decode()
+        if pygeoapi_query_params in queryparams_with_openapi:
+            openapi_responder = OpenAPIResponder(
+                self.app, self.security_schemes, augmented_bodies=self.augmented_bodies
+            )
+            await openapi_responder(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
 
 
 class OpenAPIResponder:
@@ -58,12 +64,14 @@ class OpenAPIResponder:
         app: ASGIApp,
         security_schemes: List[SecurityScheme],
         headers: Dict[Any, Any] = {},  # noqa: B006
+        augmented_bodies: Optional[MutableMapping[bytes, bytes]] = None,
     ):
         """Initialize the OpenAPI responder class."""
         self.app = app
         self.initial_message = {}  # type: Message
         self.security_schemes = security_schemes
         self.headers = headers
+        self.augmented_bodies = {} if augmented_bodies is None else augmented_bodies
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Call the Openapi responder interface."""
@@ -78,20 +86,24 @@ class OpenAPIResponder:
             # modify the outgoing headers correctly.
             self.initial_message = message
             headers = Headers(raw=self.initial_message["headers"])
-            headers_dict = dict(headers.items())
-            content_type = str(headers_dict.get("content-type"))
+            content_type = headers.get("content-type", "")
             if "application/vnd.oai.openapi+json" not in content_type:
                 logger.error(f"Incosistent content-type: {content_type}")
                 raise ValueError(f"Wrong content-type: {content_type} for openapi path")
-            self.headers.update(headers_dict)
+            self.headers.update(headers)
         if message_type == "http.response.body":
-            initial_body = message.get("body", b"").decode()
-            openapi_body = augment_security(
-                doc=initial_body, security_schemes=self.security_schemes
-            )
-            binary_body = openapi_body.model_dump_json(
-                by_alias=True, exclude_none=True, indent=2
-            ).encode()
+            initial_body = message.get("body", b"")
+            # keyed on a digest so the upstream document is not kept as a key
+            body_digest = hashlib.sha256(initial_body).digest()
+            binary_body = self.augmented_bodies.get(body_digest)
+            if binary_body is None:
+                openapi_body = augment_security(
+                    doc=initial_body.decode(), security_schemes=self.security_schemes
+                )
+                binary_body = openapi_body.model_dump_json(
+                    by_alias=True, exclude_none=True, indent=2
+                ).encode()
+                self.augmented_bodies[body_digest] = binary_body
             headers = MutableHeaders(raw=self.initial_message["headers"])
             headers["Content-Length"] = str(len(binary_body))
             message["body"] = binary_body
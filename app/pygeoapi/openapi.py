@@ -13,6 +13,11 @@ from app.pygeoapi.models import not_found
 
 logger = create_logger("app.pygeoapi.openapi")
 
+security_scheme_name = f"pygeoapi {cfg.PYGEOAPI_SECURITY_SCHEME}"
+supported_security_scheme_types = frozenset(
+    ["http", "apiKey", "oauth2", "openIdConnect"]
+)
+
 
 def augment_security(doc: str, security_schemes: List[SecurityScheme]) -> OpenAPI:
     """Augment openapi document with security sections."""
@@ -21,19 +26,16 @@ def augment_security(doc: str, security_schemes: List[SecurityScheme]) -> OpenAP
     except ValidationError as e:
         logger.error(e)
         raise
-    security_scheme_types = [
+    security_scheme_types = {
         security_scheme.type for security_scheme in security_schemes
-    ]
+    }
     _security_schemes = {"securitySchemes": {}}  # type: dict[str, dict]
-    if all(
-        item in ["http", "apiKey", "oauth2", "openIdConnect"]
-        for item in security_scheme_types
-    ):
+    if security_scheme_types <= supported_security_scheme_types:
         dumped_schemes = {}
         for scheme in security_schemes:
             dumped_schemes.update(
                 {
-                    f"pygeoapi {cfg.PYGEOAPI_SECURITY_SCHEME}": scheme.model_dump(  # noqa B950
+                    security_scheme_name: scheme.model_dump(
                         by_alias=True, exclude_none=True
                     )
                 }
@@ -49,25 +51,21 @@ def augment_security(doc: str, security_schemes: List[SecurityScheme]) -> OpenAP
     if paths:
         for key, value in paths.items():
             if value.get:
-                value.get.security = [{f"pygeoapi {cfg.PYGEOAPI_SECURITY_SCHEME}": []}]
+                value.get.security = [{security_scheme_name: []}]
                 if value.get.responses:
                     value.get.responses.update(unauthorized)
             if value.post:
-                value.post.security = [{f"pygeoapi {cfg.PYGEOAPI_SECURITY_SCHEME}": []}]
+                value.post.security = [{security_scheme_name: []}]
                 if value.post.responses:
                     value.post.responses.update(unauthorized)
             if value.options:
-                value.options.security = [
-                    {f"pygeoapi {cfg.PYGEOAPI_SECURITY_SCHEME}": []}
-                ]
+                value.options.security = [{security_scheme_name: []}]
                 if value.options.responses:
                     value.options.responses.update(unauthorized)
                     # Remove when it is fixed from pygeoapi
                     value.options.responses.update(not_found)
             if value.delete:
-                value.delete.security = [
-                    {f"pygeoapi {cfg.PYGEOAPI_SECURITY_SCHEME}": []}
-                ]
+                value.delete.security = [{security_scheme_name: []}]
                 if value.delete.responses:
                     value.delete.responses.update(unauthorized)
             secured_paths.update({key: value})
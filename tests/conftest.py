@@ -2,12 +2,41 @@
 
 import os
 import sys
+from types import MappingProxyType
 from unittest import mock
 
 import pytest
 import schemathesis
+from hypothesis import HealthCheck
+from hypothesis import Phase
+from hypothesis import settings
 from typer.testing import CliRunner
 
+# bounded example budget by default, set HYPOTHESIS_PROFILE=dev for deep fuzzing,
+# no deadline here: schemathesis swaps a deadline equal to the loaded profile's
+# for its own 15s default, so the per-example deadline stays with schemathesis
+settings.register_profile(
+    "ci",
+    max_examples=20,
+    phases=[Phase.explicit, Phase.reuse, Phase.generate],
+    suppress_health_check=[HealthCheck.too_slow],
+)
+settings.register_profile("dev", max_examples=200)
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "ci"))
+
+apikey_env_vars = MappingProxyType(
+    {
+        "API_KEY_ENABLED": "true",
+        "PYGEOAPI_KEY_GLOBAL": "pygeoapi",
+        "JWKS_ENABLED": "false",
+        "OPA_ENABLED": "false",
+    }
+)
+
+# modules dropped so that the app is rebuilt from the current environment,
+# pygeoapi's starlette app is a singleton that refuses middlewares once started
+reloadable_modules = ("app.main", "app.config.app", "pygeoapi.starlette_app")
+
 
 @pytest.fixture
 def runner() -> CliRunner:
@@ -17,10 +46,8 @@ def runner() -> CliRunner:
 
 def reload_app():
     """Reload the app with the test environment variables."""
-    if "app.main" in sys.modules:
-        del sys.modules["app.main"]
-    if "app.config.app" in sys.modules:
-        del sys.modules["app.config.app"]
+    for module in reloadable_modules:
+        sys.modules.pop(module, None)
     from app.main import app
 
     return app
@@ -37,15 +64,7 @@ def create_protected_with_apikey_app(create_app):
     """Return a protected app with an API key."""
 
     def _protected_app():
-        with mock.patch.dict(
-            os.environ,
-            {
-                "API_KEY_ENABLED": "true",
-                "PYGEOAPI_KEY_GLOBAL": "pygeoapi",
-                "JWKS_ENABLED": "false",
-                "OPA_ENABLED": "false",
-            },
-        ):
+        with mock.patch.dict(os.environ, apikey_env_vars):
             app = create_app()
         return app
 
@@ -0,0 +1,211 @@
+"""Test cases for the auth_jwks module."""
+
+import asyncio
+import os
+import sys
+import time
+from unittest import mock
+
+import httpx
+import pytest
+from authlib.jose import JsonWebKey
+from authlib.jose import JsonWebToken
+from starlette.testclient import TestClient
+
+from app.auth import auth_jwks
+from app.auth.auth_jwks import JWKSAuthentication
+from app.auth.auth_jwks import JWKSConfig
+from app.auth.auth_jwks import close_http_client
+from app.auth.auth_jwks import get_http_client
+from app.auth.exceptions import Oauth2Error
+
+jwks_uri = "https://idp.example.org/.well-known/jwks.json"
+jwks_env_vars = {
+    "DEV_JWKS_ENABLED": "true",
+    "DEV_API_KEY_ENABLED": "false",
+    "DEV_OPA_ENABLED": "false",
+}
+
+
+def generate_key(kid: str):
+    """Generate a private RSA key with the given kid."""
+    return JsonWebKey.generate_key("RSA", 2048, is_private=True, options={"kid": kid})
+
+
+def sign_token(key, kid: str) -> str:
+    """Sign a token with the key and announce the kid in its header."""
+    claims = {"sub": "pygeoapi", "exp": int(time.time()) + 60}
+    return (
+        JsonWebToken(["RS256"])
+        .encode({"alg": "RS256", "kid": kid}, claims, key)
+        .decode()
+    )
+
+
+@pytest.fixture
+def jwks_server(monkeypatch):
+    """Serve the public key set through a mocked identity provider."""
+    server = {"keys": [generate_key("k1")], "requests": 0, "outage": False}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        server["requests"] += 1
+        if server["outage"]:
+            return httpx.Response(503, text="<html>Service Unavailable</html>")
+        keys = [key.as_dict(is_private=False) for key in server["keys"]]
+        return httpx.Response(200, json={"keys": keys})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(auth_jwks, "get_http_client", lambda: client)
+    return server
+
+
+@pytest.fixture
+def reload_auth_config():
+    """Import the auth configuration again from the current environment."""
+    config_modules = ("app.config.app", "app.config.auth")
+
+    def _reload():
+        for module in config_modules:
+            sys.modules.pop(module, None)
+        from app.config.auth import auth_config
+
+        return auth_config
+
+    yield _reload
+    for module in config_modules:
+        sys.modules.pop(module, None)
+
+
+@pytest.mark.parametrize(
+    "jwks_ttl,expected_ttl", [(None, 3600), ("0", 0), ("120", 120)]
+)
+def test_jwks_ttl_setting_reaches_authentication(
+    reload_auth_config, jwks_ttl, expected_ttl
+) -> None:
+    """It caches the key set for OAUTH2_JWKS_TTL seconds, one hour if unset."""
+    with mock.patch.dict(os.environ, jwks_env_vars):
+        if jwks_ttl is None:
+            os.environ.pop("DEV_OAUTH2_JWKS_TTL", None)
+        else:
+            os.environ["DEV_OAUTH2_JWKS_TTL"] = jwks_ttl
+        auth_config = reload_auth_config()
+    (jwks_auth,) = auth_config.authentication
+    assert jwks_auth.config.jwks_ttl == expected_ttl
+    assert jwks_auth.jwks_cache.ttl == expected_ttl
+
+
+def test_cached_jwks_is_not_fetched_again(jwks_server) -> None:
+    """It decodes tokens within the TTL with a single fetch."""
+    auth = JWKSAuthentication(JWKSConfig(jwks_uri=jwks_uri))
+    token = sign_token(jwks_server["keys"][0], "k1")
+    for _ in range(3):
+        claims = asyncio.run(auth.decode_token(token))
+    assert claims["sub"] == "pygeoapi"
+    assert jwks_server["requests"] == 1
+
+
+def test_expired_jwks_is_fetched_again(jwks_server) -> None:
+    """It refetches the key set once the TTL has elapsed."""
+    auth = JWKSAuthentication(JWKSConfig(jwks_uri=jwks_uri, jwks_ttl=60))
+    token = sign_token(jwks_server["keys"][0], "k1")
+    asyncio.run(auth.decode_token(token))
+    auth.jwks_cache.expire(time.monotonic() + 61)
+    asyncio.run(auth.decode_token(token))
+    assert jwks_server["requests"] == 2
+
+
+def test_rotated_key_refreshes_jwks_once(jwks_server) -> None:
+    """It refetches the key set once for a kid missing from the cached set."""
+    auth = JWKSAuthentication(JWKSConfig(jwks_uri=jwks_uri))
+    asyncio.run(auth.get_jwks())
+    auth.jwks_fetched_at -= auth.config.jwks_refresh_interval
+    rotated_key = generate_key("k2")
+    jwks_server["keys"] = [rotated_key]
+    claims = asyncio.run(auth.decode_token(sign_token(rotated_key, "k2")))
+    assert claims["sub"] == "pygeoapi"
+    assert jwks_server["requests"] == 2
+
+
+def test_unknown_kid_is_rate_limited(jwks_server) -> None:
+    """It fails cleanly without refetching again for repeated unknown kids."""
+    auth = JWKSAuthentication(JWKSConfig(jwks_uri=jwks_uri))
+    asyncio.run(auth.get_jwks())
+    auth.jwks_fetched_at -= auth.config.jwks_refresh_interval
+    token = sign_token(generate_key("unknown"), "unknown")
+    for _ in range(3):
+        with pytest.raises(Oauth2Error):
+            asyncio.run(auth.decode_token(token))
+    assert jwks_server["requests"] == 2
+
+
+def test_jwks_outage_is_not_retried(jwks_server) -> None:
+    """It fails cleanly without treating an unavailable provider as a rotation."""
+    auth = JWKSAuthentication(JWKSConfig(jwks_uri=jwks_uri))
+    token = sign_token(jwks_server["keys"][0], "k1")
+    jwks_server["outage"] = True
+    for _ in range(5):
+        with pytest.raises(Oauth2Error, match="Unable to fetch"):
+            asyncio.run(auth.decode_token(token))
+    assert jwks_server["requests"] == 5
+    assert not auth.jwks_cache
+
+
+def test_jwks_outage_does_not_bypass_refresh_interval(jwks_server) -> None:
+    """It attempts a forced refresh once per interval while the provider is down."""
+    auth = JWKSAuthentication(JWKSConfig(jwks_uri=jwks_uri))
+    asyncio.run(auth.get_jwks())
+    auth.jwks_fetched_at -= auth.config.jwks_refresh_interval
+    jwks_server["outage"] = True
+    token = sign_token(generate_key("unknown"), "unknown")
+    for _ in range(3):
+        with pytest.raises(Oauth2Error):
+            asyncio.run(auth.decode_token(token))
+    assert jwks_server["requests"] == 2
+
+
+def test_http_client_is_shared_within_a_loop() -> None:
+    """It reuses the client on one loop and creates another on a new loop."""
+
+    async def get_twice():
+        return get_http_client(), get_http_client()
+
+    first, second = asyncio.run(get_twice())
+    other, _ = asyncio.run(get_twice())
+    assert first is second
+    assert other is not first
+
+
+def test_closed_http_client_is_recreated() -> None:
+    """It replaces a client that has been closed."""
+
+    async def get_after_close():
+        client = get_http_client()
+        await client.aclose()
+        return client, get_http_client()
+
+    closed, recreated = asyncio.run(get_after_close())
+    assert closed.is_closed
+    assert recreated is not closed
+
+
+def test_close_http_client_removes_the_loop_client() -> None:
+    """It closes the client of the running loop and forgets it."""
+
+    async def get_and_close():
+        client = get_http_client()
+        await close_http_client()
+        return client, asyncio.get_running_loop() in auth_jwks._http_clients
+
+    client, registered = asyncio.run(get_and_close())
+    assert client.is_closed
+    assert not registered
+
+
+def test_app_shutdown_closes_http_client(create_app) -> None:
+    """It closes the client of the app loop when a JWKS app shuts down."""
+    with mock.patch.dict(os.environ, jwks_env_vars):
+        app = create_app()
+    with TestClient(app) as client:
+        http_client = client.portal.call(get_http_client)
+        assert not http_client.is_closed
+    assert http_client.is_closed
@@ -0,0 +1,19 @@
+"""Test cases for the oauth2 middleware module."""
+
+from app.middleware.oauth2 import Oauth2Middleware
+from app.middleware.oauth2 import should_skip_endpoint
+
+
+def test_documentation_endpoints_are_skipped() -> None:
+    """It skips authentication for the documentation endpoints only."""
+    middleware = Oauth2Middleware(app=None, config=None)
+    for path in ["/geoapi/openapi", "/geoapi/openapi.json", "/geoapi/docs"]:
+        assert should_skip_endpoint(path, middleware.skip_endpoints)
+    for path in ["/geoapi/collections", "/openapi", "/other/geoapi/docs"]:
+        assert not should_skip_endpoint(path, middleware.skip_endpoints)
+
+
+def test_no_skip_endpoints_skips_nothing() -> None:
+    """It authenticates every endpoint when nothing is skippable."""
+    middleware = Oauth2Middleware(app=None, config=None, skip_endpoints=[])
+    assert not should_skip_endpoint("/geoapi/openapi", middleware.skip_endpoints)
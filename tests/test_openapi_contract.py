@@ -4,10 +4,13 @@ import schemathesis
 
 schema = schemathesis.from_pytest_fixture("protected_apikey_schema")
 
+# schemathesis copies case headers when building a request, so one dict is shared
+apikey_headers = {"X-API-KEY": "pygeoapi"}
+
 
 @schema.parametrize()
 def test_api(case):
     """Test the API with API-KEY protection."""
-    case.headers = {"X-API-KEY": "pygeoapi"}
+    case.headers = apikey_headers
     response = case.call_asgi()
     case.validate_response(response)
@@ -0,0 +1,21 @@
+"""Test cases for the pygeoapi middleware module."""
+
+from unittest import mock
+
+from starlette.testclient import TestClient
+
+from app.pygeoapi.openapi import augment_security
+
+
+def test_openapi_document_is_cached(create_protected_with_apikey_app) -> None:
+    """It serves the same augmented OpenAPI document without rebuilding it."""
+    client = TestClient(create_protected_with_apikey_app())
+    with mock.patch(
+        "app.middleware.pygeoapi.augment_security", wraps=augment_security
+    ) as augment:
+        first = client.get("/geoapi/openapi?f=json")
+        second = client.get("/geoapi/openapi?f=json")
+    assert first.status_code == second.status_code == 200
+    assert augment.call_count == 1
+    assert second.content == first.content
+    assert int(second.headers["content-length"]) == len(second.content)